@@ -56,16 +56,17 @@ class ListField(Field):
                                           f'got {type(val)}')
 
         nested_field: Field = self.raw_attributes.get('nested_field')
+        item_dump_options = dump_options
+        if dump_options.ignore_unchanged:
+            # ignore_unchanged used in update. Object nested in list cannot be updated partially
+            item_dump_options = replace(dump_options, ignore_unchanged=False)
+
         serialized_values = []
         for index, item in enumerate(values):
             try:
                 serialized_values.append(nested_field.get_value(
                     val=item,
-                    dump_options=replace(
-                        dump_options,
-                        # ignore_unchanged used in update. Object nested in list cannot be updated partially
-                        ignore_unchanged=False,
-                    )
+                    dump_options=item_dump_options,
                 ))
             except Exception as error:
                 from fireo.models.errors import ModelSerializingWrappedError
@@ -86,11 +87,13 @@ class ListField(Field):
         if parsed is None:
             return None
 
+        item_load_options = load_options
+        if load_options.merge:
+            # merge is not supported for list items
+            item_load_options = replace(load_options, merge=False)
+
         parsed = [
-            nested_field.field_value(item, replace(
-                load_options,
-                merge=False,  # merge is not supported for list items
-            ))
+            nested_field.field_value(item, item_load_options)
             for item in parsed
         ]
 
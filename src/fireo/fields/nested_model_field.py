@@ -8,6 +8,26 @@ if TYPE_CHECKING:
     from fireo.models import Model
 
 
+class _LazyNestedModel:
+    """Create default nested model instance on first access
+
+    Set as class attribute for required nested model fields, so model instances
+    do not create nested models which are never accessed. Assigned value is saved
+    in instance and takes precedence over this descriptor.
+    """
+
+    def __init__(self, field: 'NestedModelField'):
+        self.field = field
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return None
+
+        value = self.field.nested_model()
+        instance._set_orig_attr(self.field.name, value)
+        return value
+
+
 class NestedModelField(Field):
     """Model inside another model"""
 
@@ -19,6 +39,13 @@ class NestedModelField(Field):
             raise errors.NestedModelTypeError(f'Nested model "{model.__name__}" must be inherit from Model class')
         self.nested_model = model
 
+    def contribute_to_model(self, model_cls, name):
+        super().contribute_to_model(model_cls, name)
+        if self.raw_attributes.get('required', False):
+            # Required nested model is created on first access
+            # for direct assignment to nested model
+            setattr(model_cls, name, _LazyNestedModel(self))
+
     def valid_model(self, model_instance):
         """Check nested model and passing model is same"""
 
@@ -36,10 +63,13 @@ class NestedModelField(Field):
         if not val:
             return None
 
-        instance = getattr(load_options.model, self.name, None)
+        instance = None
+        if load_options.model is not None:
+            # Read instance dict directly, so default nested model is not created here
+            instance = load_options.model.__dict__.get(self.name)
         if instance is None or not load_options.merge:
             # create new instance if not exist or should not be merged
-            instance = self.nested_model()
+            instance = self.nested_model._empty_instance()
 
         instance.populate_from_doc_dict(
             doc_dict=val,
@@ -1,6 +1,7 @@
 """Model related Errors"""
 from typing import Tuple, TYPE_CHECKING
 
+from fireo.queries.errors import InvalidKey
 from fireo.utils.utils import join_keys
 
 if TYPE_CHECKING:
@@ -37,7 +38,12 @@ class ModelSerializingWrappedError(BaseModelError):
             self.original_error = error.original_error
 
     def __str__(self):
-        key = self.model.key
+        try:
+            key = self.model.key
+        except InvalidKey:
+            # Message must not hide original error because of invalid id
+            id_field_name, _ = self.model._meta.id
+            key = f'{self.model.collection_name}/<invalid id {getattr(self.model, id_field_name)!r}>'
         model_class = type(self.model)
         path_str = join_keys(*self.field_path)
         return (
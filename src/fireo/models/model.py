@@ -142,7 +142,7 @@ class Model(metaclass=ModelMeta):
         self.parent = parent
         if args:
             raise AttributeError('You must use keyword arguments when instantiating a model')
-        unexpected_kwargs = set(kwargs) - set(self._meta.field_list)
+        unexpected_kwargs = kwargs.keys() - self._meta.field_list.keys()
         if unexpected_kwargs:
             raise AttributeError(
                 'You passed in unknown keyword arguments: {}'.format(', '.join(unexpected_kwargs))
@@ -153,26 +153,26 @@ class Model(metaclass=ModelMeta):
             raise AbstractNotInstantiate(
                 f'Can not instantiate abstract model "{self.__class__.__name__}"')
 
-        self._field_changed = set()
+        # Values passed to constructor are changed values,
+        # mark all of them at once instead of on every assignment
+        self._field_changed = set(kwargs)
         self._extra_fields = set()
 
         # Allow users to set fields values direct from the constructor method
         for k, v in kwargs.items():
-            setattr(self, k, v)
-
-        # Create instance for nested model
-        # for direct assignment to nested model
-        for f in self._meta.field_list.values():
-            if isinstance(f, fields.NestedModelField):
-                if f.name not in kwargs:
-                    if f.raw_attributes.get('required', False):
-                        setattr(self, f.name, f.nested_model())
-                elif isinstance(kwargs[f.name], dict):
-                    warnings.warn(
-                        'Use Model.from_dict to deserialize from dict',
-                        DeprecationWarning
-                    )
-                    setattr(self, f.name, f.nested_model.from_dict(kwargs[f.name]))
+            object.__setattr__(self, k, v)
+
+        # Instance for required nested model is not created here,
+        # it is created on first access for direct assignment to nested model
+        # (see NestedModelField.contribute_to_model)
+        for k, v in kwargs.items():
+            f = self._meta.field_list[k]
+            if isinstance(f, fields.NestedModelField) and isinstance(v, dict):
+                warnings.warn(
+                    'Use Model.from_dict to deserialize from dict',
+                    DeprecationWarning
+                )
+                setattr(self, f.name, f.nested_model.from_dict(v))
 
     @classmethod
     def from_dict(cls, model_dict, by_column_name=False):
@@ -180,10 +180,28 @@ class Model(metaclass=ModelMeta):
         if model_dict is None:
             return None
 
-        instance = cls()
+        instance = cls._empty_instance()
         instance.populate_from_doc_dict(model_dict, by_column_name=by_column_name)
         return instance
 
+    @classmethod
+    def _empty_instance(cls):
+        """Create empty model instance to populate it from dict or firestore document
+
+        Skip `__init__` (kwargs handling) when model does not override it
+        """
+        if cls.__init__ is not Model.__init__:
+            return cls()
+
+        if cls._meta.abstract:
+            raise AbstractNotInstantiate(
+                f'Can not instantiate abstract model "{cls.__name__}"')
+
+        instance = cls.__new__(cls)
+        instance._field_changed = set()
+        instance._extra_fields = set()
+        return instance
+
     def merge_with_dict(self, model_dict, by_column_name=False):
         """Load data from dict into model."""
         self.populate_from_doc_dict(model_dict, merge=True, by_column_name=by_column_name)
@@ -192,39 +210,55 @@ class Model(metaclass=ModelMeta):
         """Convert model into dict"""
         model_dict = self.to_db_dict()
         id_field_name, _ = self._meta.id
-        model_dict[id_field_name] = utils.get_id(self.key)
-        model_dict['key'] = self.key
+        key = self.key
+        model_dict[id_field_name] = utils.get_id(key)
+        model_dict['key'] = key
         return model_dict
 
     def to_db_dict(self, dump_options=DumpOptions()):
         from fireo.fields import IDField
 
+        untracked_field_names = self._meta._untracked_field_names
+        # Read options once instead of for every field
+        ignore_unchanged = dump_options.ignore_unchanged
+        ignore_default_none = dump_options.ignore_default_none
+        changed_fields = self._field_changed
+        is_field_unchanged = self._is_field_unchanged
+
         result = {}
-        for field in self._meta.field_list.values():
+        for name, db_column_name, field in self._meta._field_triples:
             field: Field  # type: ignore
 
+            if (
+                ignore_unchanged and
+                name not in changed_fields and
+                name not in untracked_field_names
+            ):
+                # Field is not assigned and can not be changed in other way
+                continue
+
             if isinstance(field, IDField):
                 if not field.include_in_document:
                     # do not include ID field to dict for firestore unless it is explicitly set
                     continue
 
-            field_changed = self._is_field_unchanged(field.name)
-            if dump_options.ignore_unchanged and not field_changed:
+            field_changed = is_field_unchanged(name)
+            if ignore_unchanged and not field_changed:
                 continue
 
             try:
-                nested_field_value = getattr(self, field.name)
+                nested_field_value = getattr(self, name)
                 value = field.get_value(nested_field_value, dump_options)
             except Exception as error:
-                path = (field.name,)
+                path = (name,)
                 raise ModelSerializingWrappedError(self, path, error) from error
 
             if (
                 value is not None or
-                not dump_options.ignore_default_none or
+                not ignore_default_none or
                 field_changed
             ):
-                result[field.db_column_name] = value
+                result[db_column_name] = value
 
         return result
 
@@ -241,29 +275,35 @@ class Model(metaclass=ModelMeta):
     def populate_from_doc_dict(self, doc_dict: dict, stored=False, merge=False, by_column_name=False):
         """Populate model from Firestore document dict."""
         if not merge:
-            old_extra_fields = set(self._extra_fields) - set(self._meta.field_list)
+            old_extra_fields = self._extra_fields - self._meta.field_list.keys()
             for extra_field in old_extra_fields:
                 delattr(self, extra_field)
             self._extra_fields = set()
 
-        new_extra_fields_names = set(doc_dict) - set(self._meta.field_list)
+        new_extra_fields_names = doc_dict.keys() - self._meta.field_list.keys()
         if new_extra_fields_names and not by_column_name:
             raise NotImplementedError(
                 f"Can't populate model from dict with unknown fields: {new_extra_fields_names}"
             )
 
-        new_extra_fields = [
-            self._meta.get_field_by_column_name(field_name)
-            for field_name in new_extra_fields_names
+        new_extra_fields = []
+        for field_name in new_extra_fields_names:
+            field = self._meta.get_field_by_column_name(field_name)
             # get_field_by_column_name returns None if extra fields are ignored
-            if self._meta.get_field_by_column_name(field_name) is not None
-        ]
+            if field is not None:
+                new_extra_fields.append(field)
 
-        for field in chain(self._meta.field_list.values(), new_extra_fields):
+        lazy_nested_field_names = self._meta._lazy_nested_field_names
+        for field in chain(self._meta._field_items, new_extra_fields):
             field_name_in_dict = field.db_column_name if by_column_name else field.name
             raw_value = doc_dict.get(field_name_in_dict)
 
-            has_value = getattr(self, field.name, None) is not None
+            # Read instance dict directly, so default nested model is not created
+            # only to be replaced. Not yet created default nested model counts as value
+            if field.name in self.__dict__:
+                has_value = self.__dict__[field.name] is not None
+            else:
+                has_value = field.name in lazy_nested_field_names
             if field_name_in_dict in doc_dict or has_value and not merge:
                 # Set value from doc_dict
                 # or reset value if merge is False and field has value
@@ -319,14 +359,16 @@ class Model(metaclass=ModelMeta):
             name value dict of model
         """
         field_list = {}
-        for f in self._meta.field_list.values():
-            v = getattr(self, f.name)
-            field_changed = self._is_field_unchanged(f.name)
+        is_field_unchanged = self._is_field_unchanged
+        for f in self._meta._field_items:
+            name = f.name
+            v = getattr(self, name)
+            field_changed = is_field_unchanged(name)
             if (
                 (not ignore_unchanged or field_changed) and
                 (not ignore_default_none or field_changed or v is not None)
             ):
-                field_list[f.name] = v
+                field_list[name] = v
         return field_list
 
     @property
@@ -400,28 +442,36 @@ class Model(metaclass=ModelMeta):
         if self._key:
             return self._key
         try:
-            k = '/'.join([self.parent, self.collection_name, self._id])
-        except (TypeError, RequiredField):
-            k = '/'.join([self.parent, self.collection_name, '@temp_doc_id'])
-        if k[0] == '/':
-            return k[1:]
-        else:
-            return k
+            doc_id = self._id
+        except RequiredField:
+            doc_id = None
+        if doc_id is None:
+            return self._build_key('@temp_doc_id')
+
+        k = self._build_key(doc_id)
+        # Cache key until id or parent is changed
+        object.__setattr__(self, '_key', k)
+        return k
 
     @key.setter
     def key(self, key: str) -> None:
-        collection = key.split('/')[-2]
+        parent, collection, doc_id = utils.parse_key(key)
         assert collection == self.collection_name, 'Collection name does not match'
-        self.parent = utils.get_parent_doc(key)
-        self._id = utils.get_id(key)
+        self.parent = parent
+        self._id = doc_id
 
     def _set_key(self, doc_id):
         """Set key for model"""
-        p = '/'.join([self.parent, self.collection_name, doc_id])
-        if p[0] == '/':
-            self._key = p[1:]
-        else:
-            self._key = p
+        object.__setattr__(self, '_key', self._build_key(doc_id))
+
+    def _build_key(self, doc_id):
+        """Build key from parent, collection name and doc id"""
+        if not isinstance(doc_id, str):
+            raise InvalidKey(
+                f'Id of model "{self.__class__.__name__}" must be str, got {type(doc_id).__name__}')
+        if self.parent:
+            return '/'.join((self.parent, self.collection_name, doc_id))
+        return '/'.join((self.collection_name, doc_id))
 
     def get_firestore_create_time(self):
         """returns create time of document in Firestore
@@ -532,10 +582,11 @@ class Model(metaclass=ModelMeta):
 
         # make sure update doc in not None
         if key is not None and '@temp_doc_id' not in key:
+            parent, _, doc_id = utils.parse_key(key)
             # set parent doc from this updated document key
-            self.parent = utils.get_parent_doc(key)
+            self.parent = parent
             # Get id from key and set it for model
-            self._id = utils.get_id(key)
+            self._id = doc_id
         elif key is None and '@temp_doc_id' in self.key:
             raise InvalidKey(
                 f'Invalid key to update model "{self.__class__.__name__}" ')
@@ -559,13 +610,18 @@ class Model(metaclass=ModelMeta):
         """Keep track which filed values are changed"""
         if key in self._meta.field_list:
             self._field_changed.add(key)
-        super(Model, self).__setattr__(key, value)
+        if key in self._meta._key_attr_names:
+            # Key is built from this attribute, drop cached key
+            object.__setattr__(self, '_key', None)
+        object.__setattr__(self, key, value)
 
     def _set_orig_attr(self, key, value):
         """Keep track which filed values are changed"""
         if key != '_id' and key not in self._meta.field_list:
             self._extra_fields.add(key)
-        super(Model, self).__setattr__(key, value)
+        if key in self._meta._key_attr_names:
+            object.__setattr__(self, '_key', None)
+        object.__setattr__(self, key, value)
 
     @property
     def document_path(self):
@@ -586,6 +642,10 @@ class Model(metaclass=ModelMeta):
         if field_name in self._field_changed:
             return True
 
+        if field_name not in self._meta._untracked_field_names:
+            # Only assignment can change this field
+            return False
+
         field = self._meta.field_list[field_name]
         value = getattr(self, field_name)
         if value is not None:
@@ -80,6 +80,9 @@ class Meta:
     add_field(field):
         All all user specified fields in Model class
 
+    cache_fields():
+        Cache fields for fast iteration once the model class is created
+
     get_field(name):
         Get field from model on the base of name
 
@@ -129,6 +132,18 @@ class Meta:
         self.id = None  # Model id if user specify otherwise just None will generate late by firestore automatically
         self.field_list = {}  # Hold all the model fields
 
+        # Snapshot of `field_list` which is filled once the model class is created
+        # iterating over tuples is cheaper than over dict values on hot paths
+        self._field_items = ()
+        self._field_triples = ()  # (name, db_column_name, field)
+        # Names of fields which changes can not be tracked by assignment only
+        self._untracked_field_names = frozenset()
+        self._field_by_column = {}  # {db_column_name: field}
+        # Names of required nested model fields which default is created on first access
+        self._lazy_nested_field_names = frozenset()
+        # Model attributes from which model key is built
+        self._key_attr_names = frozenset(['parent'])
+
         # Convert Model class into collection name
         # change it to lower case and snake case
         # e.g UserCollection into user_collection
@@ -190,6 +205,34 @@ class Meta:
         """
         self.field_list[field.name] = field
 
+    def cache_fields(self):
+        """Cache fields of the model for fast iteration
+
+        Called once all the fields are attached to model class and their column names
+        are resolved. Fields are available later via **cls._meta._field_items** and
+        **cls._meta._field_triples**, by column name via **cls._meta._field_by_column**.
+        Names of fields that can be changed without assignment (mutable values,
+        auto update) are kept in **cls._meta._untracked_field_names**, required nested
+        model fields with lazy default in **cls._meta._lazy_nested_field_names**, and names of
+        attributes the model key is built from in **cls._meta._key_attr_names**
+        """
+        self._field_items = tuple(self.field_list.values())
+        if self.id:
+            self._key_attr_names = frozenset(['parent', self.id[0]])
+        self._field_triples = tuple((f.name, f.db_column_name, f) for f in self._field_items)
+        self._lazy_nested_field_names = frozenset(
+            f.name for f in self._field_items
+            if isinstance(f, fields.NestedModelField) and f.raw_attributes.get('required', False)
+        )
+        self._field_by_column = {}
+        for _, db_column_name, field in self._field_triples:
+            self._field_by_column.setdefault(db_column_name, field)
+        self._untracked_field_names = frozenset(
+            f.name for f in self._field_items
+            if isinstance(f, (fields.MapField, fields.ListField, fields.NestedModelField)) or
+            isinstance(f, fields.DateTime) and f.raw_attributes.get('auto_update', False)
+        )
+
     def get_field(self, name):
         """Get model field from field list
 
@@ -232,9 +275,9 @@ class Meta:
         FieldNotFound:
             if field not found in model class and model config for `missing_field` is **raise_error**
         """
-        for field in self.field_list.values():
-            if name == field.db_column_name:
-                return field
+        field = self._field_by_column.get(name)
+        if field is not None:
+            return field
         if self.missing_field == 'merge':
             f = fields.Field()
             f.name = name
@@ -416,6 +459,9 @@ class ModelMeta(type):
 
         mcs._generate_column_names(_meta.column_name_generator, attrs)
 
+        # Column names are final now, cache fields for fast iteration
+        _meta.cache_fields()
+
         return cls
 
     @staticmethod
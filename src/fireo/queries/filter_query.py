@@ -422,7 +422,7 @@ class FilterQuery(BaseQuery):
         filter_query = self.copy(limit=1)
         doc = next(filter_query.query.stream(filter_query._query_transaction), None)
         if doc:
-            m = query_wrapper.ModelWrapper.from_query_result(filter_query.model_cls(), doc)
+            m = query_wrapper.ModelWrapper.from_query_result(filter_query.model_cls._empty_instance(), doc)
             return m
 
         return None
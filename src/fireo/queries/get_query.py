@@ -39,8 +39,9 @@ class GetQuery(BaseQuery):
         if self.model is None:
             self.model = model_cls()
 
+        parent, _, doc_id = utils.parse_key(key)
         # set parent to this model if any
-        self.model.parent = utils.get_parent_doc(key)
+        self.model.parent = parent
         # Attach key to this model for updating this model
         # Purpose of attaching this key is user can update
         # this model after getting it
@@ -49,7 +50,7 @@ class GetQuery(BaseQuery):
         #   u = User.collection.get(user_key)
         #   u.name = "Updated Name"
         #   u.update()
-        self.id = utils.get_id(key)
+        self.id = doc_id
 
     def _raw_exec(self, transaction=None):
         """Get firestore reference and then get document based on id"""
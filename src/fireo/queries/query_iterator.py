@@ -54,7 +54,7 @@ class QueryIterator:
             if doc:
                 # Suppose this is the last doc
                 self.last_doc = doc
-                m = query_wrapper.ModelWrapper.from_query_result(self.model_cls(), doc)
+                m = query_wrapper.ModelWrapper.from_query_result(self.model_cls._empty_instance(), doc)
                 # Suppose this is last doc
                 self.last_doc_key = m.key
                 return m
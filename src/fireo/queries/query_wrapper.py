@@ -26,7 +26,7 @@ class ReferenceDocLoader:
         doc = self.ref.get()
         if not doc.exists:
             raise errors.ReferenceDocNotExist(f'{self.field.model_ref.collection_name}/{self.ref.id} not exist')
-        model = ModelWrapper.from_query_result(self.field.model_ref(), doc)
+        model = ModelWrapper.from_query_result(self.field.model_ref._empty_instance(), doc)
 
         # if on_load method is defined then call it
         if self.field.on_load:
@@ -1,5 +1,6 @@
+import functools
 import re
-from typing import List, Optional, Type, TYPE_CHECKING, Union
+from typing import List, Optional, Tuple, Type, TYPE_CHECKING, Union
 
 from google.cloud import firestore
 
@@ -8,9 +9,12 @@ from fireo.fields import Field
 if TYPE_CHECKING:
     from fireo.models.model import Model
 
+_CAMEL_RE = re.compile(r'(?!^)([A-Z]+)')
 
+
+@functools.lru_cache(maxsize=None)
 def collection_name(model):
-    return re.sub('(?!^)([A-Z]+)', r'_\1', model).lower()
+    return _CAMEL_RE.sub(r'_\1', model).lower()
 
 
 def ref_path(key):
@@ -36,6 +40,18 @@ def get_id(key):
         return None
 
 
+def parse_key(key: str) -> Tuple[str, str, str]:
+    """Split key into parent document key, collection name and document id.
+
+    Example:
+        >>> parse_key('users/user1/posts/post1')
+        ('users/user1', 'posts', 'post1')
+    """
+    parts = key.split('/')
+    collection = parts[-2] if len(parts) >= 2 else ''
+    return '/'.join(parts[:-2]), collection, parts[-1]
+
+
 def get_key(collection: str, doc_id: str, parent_key: Optional[str] = None) -> str:
     """Get key for document."""
     assert not is_key(collection), 'Collection name cannot contain "/"'
@@ -51,11 +67,16 @@ def GeoPoint(latitude: float, longitude: float):
 
 
 def get_nested(dict, *args):
-    if args and dict:
-        element = args[0]
-        if element:
-            value = dict.get(element)
-            return value if len(args) == 1 else get_nested(value, *args[1:])
+    if not args:
+        return None
+
+    value = dict
+    for element in args:
+        if not value or not element:
+            return None
+        value = value.get(element)
+
+    return value
 
 
 def join_keys(first_arg, *args):
@@ -65,14 +86,14 @@ def join_keys(first_arg, *args):
         >>> join_keys('a', 'b', 3, 'c')
         'a.b[3].c'
     """
-    result = str(first_arg)
+    parts = [str(first_arg)]
     for arg in args:
         if isinstance(arg, int):
-            result += f'[{arg}]'
+            parts.append(f'[{arg}]')
         else:
-            result += f'.{arg}'
+            parts.append(f'.{arg}')
 
-    return result
+    return ''.join(parts)
 
 
 def get_flat_dict(dict_, prefix: str = None):
@@ -83,14 +104,23 @@ def get_flat_dict(dict_, prefix: str = None):
         {'a': 1, 'b.c': 2, 'b.d.e': 3}
     """
     flat_dict = {}
-    for key, value in dict_.items():
-        if prefix:
-            key = f'{prefix}.{key}'
+    # Walk nested dicts with an explicit stack of (prefix, items iterator)
+    # pairs so keys keep the same order as the recursive traversal
+    stack = [(prefix, iter(dict_.items()))]
+    while stack:
+        current_prefix, items = stack[-1]
+        for key, value in items:
+            if current_prefix:
+                key = f'{current_prefix}.{key}'
+
+            if isinstance(value, dict):
+                stack.append((key, iter(value.items())))
+                break
 
-        if isinstance(value, dict):
-            flat_dict.update(get_flat_dict(value, key))
-        else:
             flat_dict[key] = value
+        else:
+            stack.pop()
+
     return flat_dict
 
 
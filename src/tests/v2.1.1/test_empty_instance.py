@@ -0,0 +1,83 @@
+import pytest
+
+from fireo.fields import TextField
+from fireo.models import Model
+from fireo.models.errors import AbstractNotInstantiate
+
+
+class PlainModel(Model):
+    name = TextField()
+
+
+class CustomInitModel(Model):
+    name = TextField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.custom_state = 'initialized'
+
+
+class AbstractEmptyModel(Model):
+    name = TextField()
+
+    class Meta:
+        abstract = True
+
+
+def test_plain_model_skips_init(monkeypatch):
+    init_calls = []
+    original_init = Model.__init__
+
+    def counting_init(self, *args, **kwargs):
+        init_calls.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Model, '__init__', counting_init)
+
+    instance = PlainModel._empty_instance()
+
+    assert isinstance(instance, PlainModel)
+    assert init_calls == []
+
+    # Regular constructor still goes through __init__
+    PlainModel()
+    assert len(init_calls) == 1
+
+
+def test_plain_model_instance_state():
+    instance = PlainModel._empty_instance()
+
+    assert instance._field_changed == set()
+    assert instance._extra_fields == set()
+    assert instance.parent == ''
+    assert 'parent' not in instance.__dict__
+    assert instance.name is None
+    assert instance.__dict__.keys() == {'_field_changed', '_extra_fields'}
+
+
+def test_plain_model_instance_tracks_changes():
+    instance = PlainModel._empty_instance()
+    instance.name = 'name'
+
+    assert instance._field_changed == {'name'}
+    assert instance.to_db_dict() == {'name': 'name'}
+
+
+def test_abstract_model_raises():
+    with pytest.raises(AbstractNotInstantiate):
+        AbstractEmptyModel._empty_instance()
+
+
+def test_custom_init_model_uses_constructor():
+    instance = CustomInitModel._empty_instance()
+
+    assert instance.custom_state == 'initialized'
+    assert instance._field_changed == set()
+    assert instance._extra_fields == set()
+
+
+def test_from_dict_on_plain_model_skips_init():
+    instance = PlainModel.from_dict({'name': 'name'})
+
+    assert instance.name == 'name'
+    assert instance.__dict__.keys() == {'_field_changed', '_extra_fields', 'name'}
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import pytest
+
+from fireo.fields import NestedModelField, TextField
+from fireo.models import Model
+from fireo.queries.query_wrapper import ModelWrapper
+
+
+class CountedInner(Model):
+    constructed = 0
+
+    name = TextField()
+
+    def __init__(self, *args, **kwargs):
+        CountedInner.constructed += 1
+        super().__init__(*args, **kwargs)
+
+
+class HydratedOuter(Model):
+    name = TextField()
+    inner = NestedModelField(CountedInner, required=True)
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    CountedInner.constructed = 0
+
+
+def make_doc(doc_dict):
+    return SimpleNamespace(
+        to_dict=lambda: doc_dict,
+        reference=SimpleNamespace(path='hydrated_outer/doc-id'),
+        create_time=None,
+        update_time=None,
+    )
+
+
+def test_from_dict_without_nested_creates_no_nested_model():
+    model = HydratedOuter.from_dict({'name': 'x'})
+
+    assert CountedInner.constructed == 0
+    assert model.inner is None
+
+
+def test_from_dict_with_nested_creates_one_nested_model():
+    model = HydratedOuter.from_dict({'name': 'x', 'inner': {'name': 'y'}})
+
+    assert CountedInner.constructed == 1
+    assert model.inner.name == 'y'
+
+
+def test_query_result_without_nested_creates_no_nested_model():
+    model = ModelWrapper.from_query_result(HydratedOuter._empty_instance(), make_doc({'name': 'x'}))
+
+    assert CountedInner.constructed == 0
+    assert model.inner is None
+    assert model.key == 'hydrated_outer/doc-id'
+
+
+def test_query_result_with_nested_creates_one_nested_model():
+    model = ModelWrapper.from_query_result(
+        HydratedOuter._empty_instance(),
+        make_doc({'name': 'x', 'inner': {'name': 'y'}}),
+    )
+
+    assert CountedInner.constructed == 1
+    assert model.inner.name == 'y'
+    assert model._field_changed == set()
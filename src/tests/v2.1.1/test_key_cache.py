@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+from fireo.fields import IDField, TextField
+from fireo.models import Model
+
+
+class KeyCacheModel(Model):
+    name = TextField()
+
+
+class KeyCacheCustomId(Model):
+    uid = IDField(default_factory=None)
+    name = TextField()
+
+
+def test_key_is_cached_when_id_is_set():
+    model = KeyCacheModel(id='model-id')
+
+    assert model.key == 'key_cache_model/model-id'
+    assert model._key == 'key_cache_model/model-id'
+
+
+def test_key_cache_dropped_on_parent_change():
+    model = KeyCacheModel(id='model-id')
+    assert model.key == 'key_cache_model/model-id'
+
+    model.parent = 'parent_collection/parent-id'
+
+    assert model.key == 'parent_collection/parent-id/key_cache_model/model-id'
+
+
+def test_key_set_by_id_setter_follows_parent_change():
+    model = KeyCacheModel()
+    model._id = 'model-id'
+    assert model.key == 'key_cache_model/model-id'
+
+    model.parent = 'parent_collection/parent-id'
+
+    assert model.key == 'parent_collection/parent-id/key_cache_model/model-id'
+
+
+def test_key_cache_dropped_on_id_field_change():
+    model = KeyCacheCustomId(uid='first')
+    assert model.key == 'key_cache_custom_id/first'
+
+    model.uid = 'second'
+
+    assert model.key == 'key_cache_custom_id/second'
+
+
+def test_key_cache_dropped_on_key_setter():
+    model = KeyCacheModel(id='model-id')
+    assert model.key == 'key_cache_model/model-id'
+
+    model.key = 'parent_collection/parent-id/key_cache_model/other-id'
+
+    assert model.key == 'parent_collection/parent-id/key_cache_model/other-id'
+    assert model.parent == 'parent_collection/parent-id'
+    assert model.id == 'other-id'
+
+
+def test_key_cache_dropped_on_populate_from_doc():
+    model = KeyCacheModel(id='model-id')
+    assert model.key == 'key_cache_model/model-id'
+
+    model.populate_from_doc(SimpleNamespace(
+        to_dict=lambda: {'name': 'stored'},
+        reference=SimpleNamespace(path='parent_collection/parent-id/key_cache_model/stored-id'),
+        create_time=None,
+        update_time=None,
+    ))
+
+    assert model.key == 'parent_collection/parent-id/key_cache_model/stored-id'
+    assert model.name == 'stored'
+
+
+def test_temp_key_is_not_cached():
+    model = KeyCacheCustomId()
+
+    assert model.key == 'key_cache_custom_id/@temp_doc_id'
+    assert model._key is None
+
+    model.uid = 'model-id'
+
+    assert model.key == 'key_cache_custom_id/model-id'
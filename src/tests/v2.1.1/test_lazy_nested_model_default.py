@@ -0,0 +1,78 @@
+from fireo.fields import NestedModelField, TextField
+from fireo.models import Model
+
+
+class LazyInner(Model):
+    name = TextField()
+
+
+class LazyOuter(Model):
+    inner = NestedModelField(LazyInner, required=True)
+    optional_inner = NestedModelField(LazyInner)
+
+
+class AbstractLazyOuter(Model):
+    inner = NestedModelField(LazyInner, required=True)
+
+    class Meta:
+        abstract = True
+
+
+class InheritedLazyOuter(AbstractLazyOuter):
+    name = TextField()
+
+
+def test_class_access_returns_none():
+    assert LazyOuter.inner is None
+    assert LazyOuter.optional_inner is None
+
+
+def test_default_is_not_created_in_constructor():
+    model = LazyOuter()
+
+    assert 'inner' not in model.__dict__
+    assert model.optional_inner is None
+
+
+def test_first_read_creates_and_caches_default():
+    model = LazyOuter()
+
+    inner = model.inner
+
+    assert isinstance(inner, LazyInner)
+    assert model.inner is inner
+    assert model.__dict__['inner'] is inner
+    assert 'inner' not in model._field_changed
+
+
+def test_direct_assignment_to_default():
+    model = LazyOuter()
+    model.inner.name = 'direct'
+
+    assert model.to_db_dict()['inner'] == {'name': 'direct'}
+
+
+def test_assignment_shadows_default():
+    model = LazyOuter()
+    inner = LazyInner(name='assigned')
+
+    model.inner = inner
+
+    assert model.inner is inner
+    assert 'inner' in model._field_changed
+
+
+def test_explicit_none_kwarg_stays_none():
+    model = LazyOuter(inner=None)
+
+    assert model.inner is None
+
+
+def test_inherited_required_nested_field():
+    assert InheritedLazyOuter.inner is None
+
+    model = InheritedLazyOuter(name='name')
+
+    assert isinstance(model.inner, LazyInner)
+    assert model.inner is model.inner
+    assert model.to_db_dict()['inner'] == {'name': None}
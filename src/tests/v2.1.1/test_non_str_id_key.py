@@ -0,0 +1,55 @@
+import pytest
+
+from fireo.fields import IDField, TextField
+from fireo.models import Model
+from fireo.models.errors import ModelSerializingWrappedError
+from fireo.queries.errors import InvalidKey
+
+
+class NonStrIdModel(Model):
+    uid = IDField(default_factory=None)
+    name = TextField()
+
+
+def test_key_with_non_str_id_raises_invalid_key():
+    model = NonStrIdModel()
+    model.uid = 5
+
+    with pytest.raises(InvalidKey):
+        model.key
+
+
+def test_to_dict_with_non_str_id_raises_invalid_key():
+    model = NonStrIdModel(uid=5, name='name')
+
+    with pytest.raises(InvalidKey):
+        model.to_dict()
+
+
+def test_set_non_str_id_raises_invalid_key():
+    model = NonStrIdModel()
+
+    with pytest.raises(InvalidKey):
+        model._id = 5
+
+
+def test_key_with_str_id():
+    model = NonStrIdModel(uid='5')
+
+    assert model.key == 'non_str_id_model/5'
+
+
+class NonStrIdRequiredModel(Model):
+    uid = IDField(default_factory=None)
+    name = TextField(required=True)
+
+
+def test_serializing_error_message_with_non_str_id():
+    model = NonStrIdRequiredModel(uid=5)
+
+    with pytest.raises(ModelSerializingWrappedError) as exc_info:
+        model.to_db_dict()
+
+    message = str(exc_info.value)
+    assert "with key 'non_str_id_required_model/<invalid id 5>'" in message
+    assert "due to error in field 'name'" in message
@@ -0,0 +1,40 @@
+import pytest
+
+from fireo.fields import TextField
+from fireo.models import Model
+from fireo.utils import utils
+
+
+class ParseKeyModel(Model):
+    name = TextField()
+
+
+def test_parse_top_level_key():
+    assert utils.parse_key('users/user1') == ('', 'users', 'user1')
+
+
+def test_parse_nested_key():
+    assert utils.parse_key('users/user1/posts/post1') == ('users/user1', 'posts', 'post1')
+    assert utils.parse_key('a/1/b/2/c/3') == ('a/1/b/2', 'c', '3')
+
+
+def test_parse_key_without_collection():
+    assert utils.parse_key('user1') == ('', '', 'user1')
+
+
+def test_parse_key_with_trailing_slash():
+    assert utils.parse_key('users/') == ('', 'users', '')
+
+
+def test_model_key_setter_rejects_key_without_collection():
+    model = ParseKeyModel()
+
+    with pytest.raises(AssertionError):
+        model.key = 'model-id'
+
+
+def test_model_key_setter_rejects_other_collection():
+    model = ParseKeyModel()
+
+    with pytest.raises(AssertionError):
+        model.key = 'other_collection/model-id'